@@ -25,55 +25,55 @@ activities = {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     },
     "Basketball Team": {
         "description": "Competitive basketball training and inter-school matches",
         "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
         "max_participants": 15,
-        "participants": ["james@mergington.edu", "liam@mergington.edu"]
+        "participants": {"james@mergington.edu", "liam@mergington.edu"}
     },
     "Swimming Club": {
         "description": "Swimming techniques and competitive training",
         "schedule": "Mondays and Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 20,
-        "participants": ["ava@mergington.edu", "noah@mergington.edu"]
+        "participants": {"ava@mergington.edu", "noah@mergington.edu"}
     },
     "Drama Club": {
         "description": "Acting, theater production, and performing arts",
         "schedule": "Wednesdays, 3:30 PM - 5:30 PM",
         "max_participants": 25,
-        "participants": ["isabella@mergington.edu", "ethan@mergington.edu"]
+        "participants": {"isabella@mergington.edu", "ethan@mergington.edu"}
     },
     "Art Studio": {
         "description": "Painting, drawing, and mixed media art projects",
         "schedule": "Thursdays, 3:00 PM - 5:00 PM",
         "max_participants": 18,
-        "participants": ["mia@mergington.edu", "lucas@mergington.edu"]
+        "participants": {"mia@mergington.edu", "lucas@mergington.edu"}
     },
     "Debate Team": {
         "description": "Develop critical thinking and public speaking through debates",
         "schedule": "Fridays, 4:00 PM - 6:00 PM",
         "max_participants": 16,
-        "participants": ["charlotte@mergington.edu", "william@mergington.edu"]
+        "participants": {"charlotte@mergington.edu", "william@mergington.edu"}
     },
     "Science Olympiad": {
         "description": "Competitive science events and hands-on experiments",
         "schedule": "Tuesdays, 3:30 PM - 5:30 PM",
         "max_participants": 20,
-        "participants": ["amelia@mergington.edu", "benjamin@mergington.edu"]
+        "participants": {"amelia@mergington.edu", "benjamin@mergington.edu"}
     }
 }
 
@@ -103,7 +103,7 @@ def signup_for_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student is already signed up")
 
     # Add student
-    activity["participants"].append(email)
+    activity["participants"].add(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 